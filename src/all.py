@@ -8,35 +8,11 @@ Usage: `import all`
 
 import builtins
 import sys
-from types import FrameType, ModuleType
+from types import ModuleType
 from typing import cast
 
 from importall import importall
-
-
-class GetImporterFrameError(Exception):
-    "An exception to signal that get_importer_frame() fails"
-
-
-def get_importer_frame() -> FrameType:
-    """
-    Get the frame of the importer who imports the current module.
-
-    Raise GetImporterFrameError if such frame can't be found.
-    """
-
-    frame = sys._getframe()
-
-    while frame and frame.f_globals["__package__"] != "importlib":
-        frame = frame.f_back
-
-    while frame and frame.f_globals["__package__"] == "importlib":
-        frame = frame.f_back
-
-    if not frame:
-        raise GetImporterFrameError
-
-    return frame
+from importall.inspect import GetImporterFrameError, get_importer_frame
 
 
 try:
@@ -8,37 +8,46 @@ Usage: `python -m importall [-h] [script]`
 
 initial_globals = globals().copy()
 
-import argparse
 import builtins
 import code
 import runpy
 import sys
 
-import colorama
-from colorama import Fore, Style
-
 from .importall import get_all_symbols, importall
 
 
-colorama.init()
+# NOTE `colorama` and `argparse` are imported where they are used, instead of at the
+# module level, so that their import overhead is only paid on the code paths that
+# actually need them. For example, running a script needs no colored output.
 
 
 def highlight(s: str) -> str:
+    from colorama import Style
+
     return Style.BRIGHT + s + Style.RESET_ALL
 
 
 def bright_green(s: str) -> str:
+    from colorama import Fore, Style
+
     return Style.BRIGHT + Fore.GREEN + s + Style.RESET_ALL
 
 
 def run_script(script: str) -> None:
 
     importall(builtins.__dict__)
-    runpy.run_path(script)
+
+    # Run the script as the main module, like `python script.py` does, so that its
+    # `if __name__ == "__main__":` block is executed.
+    runpy.run_path(script, run_name="__main__")
 
 
 def run_repl() -> None:
 
+    import colorama
+
+    colorama.init()
+
     prompt = getattr(sys, "ps1", ">>> ")
 
     banner = (
@@ -54,13 +63,18 @@ def run_repl() -> None:
 
     exitmsg = "exiting importall REPL..."
 
-    inject_globals = initial_globals | get_all_symbols()
+    # The snapshot is taken once per process, and only used here. Populate it in place,
+    # instead of merging it with the symbol table into yet another dict.
+    inject_globals = initial_globals
+    inject_globals.update(get_all_symbols())
 
     code.interact(banner=banner, local=inject_globals, exitmsg=exitmsg)
 
 
 def main() -> None:
 
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="python -m importall",
         usage="python -m importall [-h] [script]",
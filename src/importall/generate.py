@@ -26,9 +26,18 @@ KNOWN_FALSE_POSITIVES = {"_thread": {"exit_thread"}}
 
 async def generate_stdlib_public_names() -> dict[str, list[str]]:
 
+    # Deductions of modules without `__all__` launch a new interpreter instance to
+    # wildcard-import the module, and await it. The in-process part of each deduction
+    # runs on the event loop thread, so those subprocesses are the only work that
+    # overlaps. Bound the number of deductions in flight to the CPU count, so that at
+    # most that many interpreter instances run at once, instead of up to hundreds,
+    # which contend for the cores and the memory.
+    semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
     async def helper(module_name: str) -> list[str]:
 
-        public_names = await deduce_stdlib_public_interface(module_name)
+        async with semaphore:
+            public_names = await deduce_stdlib_public_interface(module_name)
 
         # Remove false positives
         public_names -= KNOWN_FALSE_POSITIVES.get(module_name, set())
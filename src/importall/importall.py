@@ -1,15 +1,26 @@
 from collections.abc import Iterable, Mapping
-from typing import Union, cast
+from functools import cache
+from typing import Optional, Union, cast
 from uuid import uuid4
 
-from .inspect import getcallerframe, is_called_at_module_level
+from .importlib import (
+    import_modules_concurrently,
+    import_name_from_module,
+    import_names_from_module,
+)
+from .inspect import getcallerframe, is_module_level_frame
 from .stdlib_list import BUILTINS_NAMES, IMPORTABLE_STDLIB_MODULES
-from .stdlib_utils import deprecated_modules, import_stdlib_public_names
+from .stdlib_utils import (
+    deprecated_modules,
+    deprecated_names,
+    modules_with_deprecated_names,
+    stdlib_public_names,
+)
 from .typing import SymbolTable
 from .utils import profile
 
 
-__all__ = ["importall", "deimportall", "get_all_symbols"]
+__all__ = ["importall", "deimportall", "get_all_symbols", "clear_symbols_cache"]
 
 
 KEY_TRACKING_INJECTED_SYMBOLS = uuid4().hex
@@ -69,14 +80,17 @@ def importall(
     nonterminal `future_stmt` in https://docs.python.org/3/reference/simple_stmts.html#future-statements).
     """
 
-    # Check against invocation at non-module level
-    if namespace is None and not is_called_at_module_level():
-        raise RuntimeError(
-            "importall() function with default namespace argument is only allowed to be invoked at the module level"
-        )
-
     if namespace is None:
-        namespace = getcallerframe().f_globals
+        # Fetch the caller's frame once, both to check against invocation at non-module
+        # level, and to take its globals.
+        frame = getcallerframe()
+
+        if not is_module_level_frame(frame):
+            raise RuntimeError(
+                "importall() function with default namespace argument is only allowed to be invoked at the module level"
+            )
+
+        namespace = frame.f_globals
 
     symtab = get_all_symbols(
         lazy=lazy,
@@ -86,11 +100,20 @@ def importall(
     )
 
     if protect_builtins:
-        for name in BUILTINS_NAMES:
-            symtab.pop(name, None)
+        # Only visit the built-in names actually present, computed by a C-level set
+        # intersection, instead of trying to pop every built-in name.
+        for name in symtab.keys() & BUILTINS_NAMES:
+            del symtab[name]
 
     namespace.update(symtab)
 
+    # Accumulate across repeated calls, so that deimportall() also removes symbols
+    # injected by earlier calls that the latest call didn't override.
+    if previous := namespace.get(KEY_TRACKING_INJECTED_SYMBOLS):
+        merged = dict(cast(SymbolTable, previous))
+        merged.update(symtab)
+        symtab = merged
+
     namespace[KEY_TRACKING_INJECTED_SYMBOLS] = symtab
 
 
@@ -99,7 +122,7 @@ def deimportall(namespace: SymbolTable = None) -> None:
     De-import all imported names. Recover/restore the namespace.
 
     More precisely, `deimportall()` removes, from the namespace, symbols introduced by
-    the previous call to `importall()`. Sometimes it's possible that `importall()`
+    all previous calls to `importall()`, which accumulate across calls. Sometimes it's possible that `importall()`
     introduces a symbol that overrides the old symbol with the same name.
     `deimportall()` is intentionally designed to not pay effort to restore the old
     symbol, mainly to avoid adding considerable complexity to the implementation.
@@ -112,19 +135,26 @@ def deimportall(namespace: SymbolTable = None) -> None:
     RuntimeError.
     """
 
-    # Check against invocation at non-module level
-    if namespace is None and not is_called_at_module_level():
-        raise RuntimeError(
-            "deimportall() function with default namespace argument is only allowed to be invoked at the module level"
-        )
-
     if namespace is None:
-        namespace = getcallerframe().f_globals
+        # Fetch the caller's frame once, both to check against invocation at non-module
+        # level, and to take its globals.
+        frame = getcallerframe()
+
+        if not is_module_level_frame(frame):
+            raise RuntimeError(
+                "deimportall() function with default namespace argument is only allowed to be invoked at the module level"
+            )
+
+        namespace = frame.f_globals
 
     injected_symbols = cast(
-        SymbolTable, namespace.pop(KEY_TRACKING_INJECTED_SYMBOLS, {})
+        Optional[SymbolTable], namespace.pop(KEY_TRACKING_INJECTED_SYMBOLS, None)
     )
 
+    # Fast path: the namespace has never been injected symbols by importall()
+    if injected_symbols is None:
+        return
+
     sentinel = object()
 
     for name, symbol in injected_symbols.items():
@@ -166,33 +196,134 @@ def get_all_symbols(
     The `ignore` parameter accepts an iterable of strings specifying modules that should
     be skipped and not imported.
 
+    The result is memoized per process for each distinct combination of arguments, so
+    repeated calls are cheap. Every call returns a fresh copy, which is safe to mutate.
+    Call `clear_symbols_cache()` to discard the memoized results, e.g. after the module
+    cache has been cleaned up or modules have been reloaded.
+
     Despite imported, features in the `__future__` module are not enabled, as they are
     not imported in the form of future statements (See the production rule for the
     nonterminal `future_stmt` in https://docs.python.org/3/reference/simple_stmts.html#future-statements).
     """
 
-    if isinstance(prioritized, Mapping):
-        priorities = prioritized
+    # Copy into a plain dict, whose lookups are much cheaper than those of an arbitrary
+    # Mapping implementation, e.g. the Python-level `Mapping.get()` mixin method.
+    #
+    # Detect the mapping form by duck typing, the same way the dict() constructor does,
+    # instead of the comparatively expensive ABC isinstance() check.
+    if hasattr(prioritized, "keys"):
+        priorities = dict(cast(Mapping[str, int], prioritized))
     else:
-        priorities = {module: 1 for module in prioritized}
+        priorities = dict.fromkeys(prioritized, 1)
+
+    # Hand out a copy of the memoized symbol table, so that callers are free to mutate it
+    return dict(
+        _get_all_symbols(
+            lazy=lazy,
+            include_deprecated=include_deprecated,
+            priorities=frozenset(priorities.items()),
+            ignore=frozenset(ignore),
+        )
+    )
+
+
+@cache
+def _get_all_symbols(
+    *,
+    lazy: bool,
+    include_deprecated: bool,
+    priorities: frozenset[tuple[str, int]],
+    ignore: frozenset[str],
+) -> SymbolTable:
+    """
+    The memoized implementation of `get_all_symbols()`. Arguments are normalized to
+    hashable forms by the caller.
+
+    The returned symbol table is shared across calls, and hence should never be mutated.
+    """
 
-    # Ignore user-specified modules.
-    module_names = IMPORTABLE_STDLIB_MODULES - set(ignore)
+    # Ignore user-specified modules. Skip the set difference in the common case of
+    # nothing to ignore.
+    if ignore:
+        module_names = IMPORTABLE_STDLIB_MODULES - ignore
+    else:
+        module_names = IMPORTABLE_STDLIB_MODULES
 
     if not include_deprecated:
         # Ignore deprecated modules
         module_names -= deprecated_modules()
 
     # When priority score ties, choose the one whose name has higher lexicographical order.
-    module_names = sorted(
-        module_names, key=lambda name: (priorities.get(name, 0), name)
-    )
+    if priorities:
+        # Decorate-sort-undecorate, instead of calling a Python-level key function
+        get_priority = dict(priorities).get
+        decorated = sorted((get_priority(name, 0), name) for name in module_names)
+        module_names = [name for _, name in decorated]
+    else:
+        # In the common case of no priorities, all scores tie. Sort by name directly,
+        # without the overhead of a key function.
+        module_names = sorted(module_names)
+
+    # Resolve which module each name is imported from, using the static data of stdlib
+    # public names, before actually importing anything. Names from modules later in the
+    # order override names from modules earlier in the order. This way, every name is
+    # imported only once, from its winning module, and modules whose names all lose are
+    # not imported at all.
+    name_to_module: dict[str, str] = {}
+
+    # Most modules have no deprecated names in any version. Skip the deprecated names
+    # lookup for them altogether.
+    if include_deprecated:
+        modules_to_filter: frozenset[str] = frozenset()
+    else:
+        modules_to_filter = modules_with_deprecated_names()
+
+    for module_name in module_names:
+        public_names: Iterable[str] = stdlib_public_names(module_name)
+
+        if module_name in modules_to_filter:
+            # Filter in a single pass, instead of allocating a set difference per module.
+            # A module's deprecations may all be from later versions, and then need no
+            # filtering at all.
+            if deprecated := deprecated_names(module_name):
+                public_names = (
+                    name for name in public_names if name not in deprecated
+                )
+
+        name_to_module.update(dict.fromkeys(public_names, module_name))
+
+    if lazy:
+        return {
+            name: import_name_from_module(name, module_name, lazy=True)
+            for name, module_name in name_to_module.items()
+        }
+
+    # Group the names by their winning modules, so that the symbol table is populated in
+    # one batch per module, instead of one import per name.
+    module_to_names: dict[str, list[str]] = {}
+
+    for name, module_name in name_to_module.items():
+        module_to_names.setdefault(module_name, []).append(name)
+
+    # Warm up the module cache concurrently. The symbol table itself is still populated
+    # serially below.
+    import_modules_concurrently(module_to_names)
 
     symtab: SymbolTable = {}
 
-    for module_name in module_names:
-        symtab |= import_stdlib_public_names(
-            module_name, lazy=lazy, include_deprecated=include_deprecated
-        )
+    for module_name, names in module_to_names.items():
+        symtab.update(import_names_from_module(names, module_name))
 
     return symtab
+
+
+def clear_symbols_cache() -> None:
+    """
+    Discard the memoized results of `get_all_symbols()`.
+
+    Useful when the memoized symbols have gone stale, e.g. after `sys.modules` has been
+    cleaned up or modules have been reloaded, so that subsequent calls import the
+    symbols afresh.
+    """
+
+    _get_all_symbols.cache_clear()
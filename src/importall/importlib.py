@@ -1,14 +1,23 @@
 import __future__
 
+import importlib
+import os
 import sys
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal, overload
 
 from .typing import SymbolTable
 from .utils import profile, provide_lazy_version
 
 
-__all__ = ["import_name_from_module", "wildcard_import_module", "clean_up_import_cache"]
+__all__ = [
+    "import_name_from_module",
+    "import_names_from_module",
+    "wildcard_import_module",
+    "import_modules_concurrently",
+    "clean_up_import_cache",
+]
 
 
 MODULE_STR_VALUED_ATTRIBUTES = Literal[
@@ -48,9 +57,10 @@ def import_name_from_module(name: str, module: str) -> object:
     external code that the actual import happens. Useful when importing some modules are
     considered expensive.
 
-    NOTE that `exec("from xxx import yyy")` is not equivalent to the naive snippet
+    NOTE that `from xxx import yyy` is not equivalent to the naive snippet
     `getattr(importlib.import_module(xxx), yyy)`. They differ in some cases, such as
-    when the name to import is a submodule.
+    when the name to import is a not-yet-imported submodule. This function follows the
+    semantics of the former.
 
     Raise `ModuleNotFoundError` if the module can't be located, and `ImportError` if the
     loading process fail or the name can't be found from the module.
@@ -70,8 +80,69 @@ def import_name_from_module(name: str, module: str) -> object:
     if module == "builtins" and name in {"True", "False", "None", "__debug__"}:
         return eval(name)
 
-    exec(f"from {module} import {name}")
-    return eval(name)
+    # Peek at the module cache first. Calling `importlib.import_module()` on an already
+    # imported module still goes through the import lock and several lookups.
+    if (module_object := sys.modules.get(module)) is None:
+        module_object = importlib.import_module(module)
+
+    # Fast path: most names are plain entries in the namespace of the module. Looking
+    # them up in the module's `__dict__` skips the attribute lookup machinery.
+    module_dict = vars(module_object)
+    if name in module_dict:
+        return module_dict[name]
+
+    # Mimic the semantics of `from xxx import yyy` directly, instead of compiling and
+    # executing an import statement per name. First try the attribute, which also covers
+    # names provided by a module level `__getattr__()`, then try the name as a submodule.
+    # Reference: https://docs.python.org/3/reference/simple_stmts.html#the-import-statement
+
+    try:
+        return getattr(module_object, name)
+    except AttributeError:
+        pass
+
+    submodule = f"{module}.{name}"
+
+    try:
+        return importlib.import_module(submodule)
+    except ModuleNotFoundError as exc:
+        # Only translate the error if it is the submodule itself that is missing, not
+        # some module imported during its execution.
+        if exc.name != submodule:
+            raise
+
+    raise ImportError(f"cannot import name '{name}' from '{module}'", name=module)
+
+
+@profile
+def import_names_from_module(names: Iterable[str], module: str) -> SymbolTable:
+    """
+    Programmatically import names from a module. Return a symbol table of the imported
+    names.
+
+    Equivalent to calling `import_name_from_module()` on each name, but cheaper, because
+    the module and its namespace are looked up only once for the whole batch.
+
+    Raise `ModuleNotFoundError` if the module can't be located, and `ImportError` if the
+    loading process fail or any name can't be found from the module.
+    """
+
+    # The __future__ and builtins modules are special cases. Refer to the implementation
+    # of `import_name_from_module()` for details.
+    if module in {"__future__", "builtins"}:
+        return {name: import_name_from_module(name, module) for name in names}
+
+    if (module_object := sys.modules.get(module)) is None:
+        module_object = importlib.import_module(module)
+
+    module_dict = vars(module_object)
+
+    return {
+        name: module_dict[name]
+        if name in module_dict
+        else import_name_from_module(name, module)
+        for name in names
+    }
 
 
 @profile
@@ -87,12 +158,60 @@ def wildcard_import_module(module_name: str) -> SymbolTable:
     if module_name == "__future__":
         return {name: getattr(__future__, name) for name in __future__.__all__}
 
-    symtab: SymbolTable = {}
-    # NOTE it's more robust to use the `locals` argument instead of the `globals`
-    # argument to collect symbols, because the `globals` argument could have been
-    # implicitly and surprisingly altered, such as being inserted a `__builtins__` key.
-    exec(f"from {module_name} import *", {}, symtab)
-    return symtab
+    # Mimic the semantics of `from xxx import *` directly, instead of compiling and
+    # executing an import statement for every module.
+    # Reference: https://docs.python.org/3/reference/simple_stmts.html#the-import-statement
+
+    if (module := sys.modules.get(module_name)) is None:
+        module = importlib.import_module(module_name)
+
+    # If the module defines `__all__`, the names listed there are imported, which may
+    # include not-yet-imported submodules. Otherwise, all names in the namespace of the
+    # module, except those beginning with an underscore, are imported.
+    if (dunder_all := getattr(module, "__all__", None)) is not None:
+        names = dunder_all
+    else:
+        names = [name for name in vars(module) if not name.startswith("_")]
+
+    return import_names_from_module(names, module_name)
+
+
+def _try_import_module(module_name: str) -> None:
+
+    # Catch Exception instead of BaseException, because we don't want to hinder
+    # system-exiting exceptions from propagating up.
+    try:
+        importlib.import_module(module_name)
+    except Exception:
+        pass
+
+
+@profile
+def import_modules_concurrently(module_names: Iterable[str]) -> None:
+    """
+    Import modules with a thread pool, so as to populate the module cache `sys.modules`
+    ahead of time.
+
+    Importing a module is dominated by filesystem lookups and reads, which release the
+    GIL. Overlapping them across threads reduces the wall-clock time of importing a
+    batch of modules.
+
+    Failures are silently ignored here. They are expected to surface when the module is
+    imported again, in the caller's thread.
+    """
+
+    # Already imported modules need no work. Don't bother spinning up threads for them.
+    pending = [module for module in module_names if module not in sys.modules]
+
+    if not pending:
+        return
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(pending))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the iterator so that all imports finish before returning
+        for _ in executor.map(_try_import_module, pending):
+            pass
 
 
 def clean_up_import_cache(module_name: str) -> None:
@@ -120,12 +239,13 @@ def clean_up_import_cache(module_name: str) -> None:
         # When a module is imported, its submodules are possibly also implicitly
         # imported.
 
-        submodules = []
+        # Match by prefix, built once, instead of splitting every module name. This also
+        # covers submodules of a module which is itself a submodule, e.g.
+        # `email.mime.text`.
+        prefix = module_name + "."
 
-        for mod in sys.modules:
-            root, *branches = mod.split(".")
-            if root == module_name and branches:
-                submodules.append(mod)
+        # Collect the names before deleting, to not mutate sys.modules while iterating
+        submodules = [mod for mod in sys.modules if mod.startswith(prefix)]
 
         for mod in submodules:
             del sys.modules[mod]
@@ -2,7 +2,13 @@ import sys
 from types import FrameType
 
 
-__all__ = ["getcallerframe", "is_called_at_module_level"]
+__all__ = [
+    "getcallerframe",
+    "is_called_at_module_level",
+    "is_module_level_frame",
+    "GetImporterFrameError",
+    "get_importer_frame",
+]
 
 
 def getcallerframe() -> FrameType:
@@ -31,6 +37,12 @@ def is_called_at_module_level() -> bool:
             "is_called_at_module_level() expects to be called in a function"
         )
 
+    return is_module_level_frame(frame)
+
+
+def is_module_level_frame(frame: FrameType) -> bool:
+    """Check if the frame is executing code at the module level"""
+
     # There is currently no reliable and officially-provided way to determine whether a
     # function is called from the module level or not.
     #
@@ -44,3 +56,83 @@ def is_called_at_module_level() -> bool:
     # We are good with the current approach as it works for most cases.
 
     return frame.f_code.co_name == "<module>"
+
+
+# The depth of the importer's frame, relative to get_importer_frame(), when the calling
+# module is imported by a plain `import xxx` statement: get_importer_frame() itself, the
+# module level code of the calling module, then five frames of the import machinery.
+IMPORTER_FRAME_DEPTH = 7
+
+
+# The frozen bootstrap modules of the import machinery. They are renamed to
+# `importlib._bootstrap` and `importlib._bootstrap_external` once the `importlib`
+# package has been imported, which is not guaranteed to have happened by the time the
+# calling module is imported.
+FROZEN_IMPORTLIB_MODULES = frozenset({"_frozen_importlib", "_frozen_importlib_external"})
+
+
+def is_import_machinery_frame(frame: FrameType) -> bool:
+    """
+    Check if the frame is executing code of the import machinery, i.e., the `importlib`
+    package, any of its submodules, or the frozen bootstrap modules.
+    """
+
+    # Frames are recognized by the module names of their globals. The `__package__` of
+    # the frozen bootstrap modules is not reliable for this purpose: it only reads
+    # "importlib" after they have been renamed as described above.
+
+    name = frame.f_globals.get("__name__")
+
+    if not isinstance(name, str):
+        return False
+
+    return (
+        name == "importlib"
+        or name.startswith("importlib.")
+        or name in FROZEN_IMPORTLIB_MODULES
+    )
+
+
+class GetImporterFrameError(Exception):
+    "An exception to signal that get_importer_frame() fails"
+
+
+def get_importer_frame() -> FrameType:
+    """
+    Get the frame of the importer who imports the current module, i.e., the module at
+    whose module level `get_importer_frame()` is called.
+
+    Raise `GetImporterFrameError` if such frame can't be found.
+    """
+
+    # Fast path: for a plain `import xxx` statement, the import machinery in practice
+    # puts a fixed number of frames between the imported module and the importer. Fetch
+    # the frames at that depth directly, and verify that the candidate frame is called
+    # right from the import machinery. Otherwise fall back to walking the stack.
+    try:
+        callee = sys._getframe(IMPORTER_FRAME_DEPTH - 1)
+    except ValueError:
+        pass
+    else:
+        frame = callee.f_back
+        if (
+            frame
+            and is_import_machinery_frame(callee)
+            and not is_import_machinery_frame(frame)
+        ):
+            return frame
+
+    # Walk up the stack in a single pass. The importer's frame is the first frame
+    # outside the import machinery, after the frames of the import machinery.
+
+    frame = sys._getframe()
+    seen_importlib = False
+
+    while frame:
+        if is_import_machinery_frame(frame):
+            seen_importlib = True
+        elif seen_importlib:
+            return frame
+        frame = frame.f_back
+
+    raise GetImporterFrameError
@@ -1,5 +1,6 @@
 import builtins
 import os
+from itertools import chain
 
 from recipes.sys import tk_is_available
 from stdlib_list import stdlib_list
@@ -13,7 +14,9 @@ __all__ = [
 ]
 
 
-BUILTINS_NAMES = frozenset(dir(builtins)) - {
+# Iterate the namespace of the builtins module directly, instead of calling dir(), which
+# needlessly materializes a sorted list of the same keys.
+BUILTINS_NAMES = frozenset(vars(builtins)) - {
     "__build_class__",
     "__doc__",
     "__loader__",
@@ -35,12 +38,10 @@ BUILTINS_NAMES = frozenset(dir(builtins)) - {
 # 2. List maintained by the `stdlib-list` library:
 # https://github.com/jackmaney/python-stdlib-list/blob/master/stdlib_list/lists/3.9.txt
 
-STDLIB_MODULES = frozenset(stdlib_list())
-
 # Patch stdlib-list: add missing standard libraries
 # TODO open an issue in https://github.com/jackmaney/python-stdlib-list/
 # FIXME should we consider these standard libraries ? What's the authority definition of "standard libraries" in Python?
-STDLIB_MODULES |= {"msilib.schema", "msilib.sequence", "msilib.text"}
+MISSING_STDLIB_MODULES = {"msilib.schema", "msilib.sequence", "msilib.text"}
 
 # Patch stdlib-list: some modules should not be considered public standard libraries
 # TODO open an issue in https://github.com/jackmaney/python-stdlib-list/
@@ -52,11 +53,18 @@ STDLIB_MODULES |= {"msilib.schema", "msilib.sequence", "msilib.text"}
 # on the console, and we don't yet know why.
 #
 # The `antigravity` and `this` modules are easter eggs.
-STDLIB_MODULES -= {"__main__", "__phello__.foo", "antigravity", "this"}
+NONPUBLIC_STDLIB_MODULES = {"__main__", "__phello__.foo", "antigravity", "this"}
 
 # The `test` package is for Python dev internal use, and should not be considered public
 # standard library.
-STDLIB_MODULES -= {mod for mod in STDLIB_MODULES if mod.split(".")[0] == "test"}
+NONPUBLIC_STDLIB_PACKAGES = {"test"}
+
+STDLIB_MODULES = frozenset(
+    mod
+    for mod in chain(stdlib_list(), MISSING_STDLIB_MODULES)
+    if mod not in NONPUBLIC_STDLIB_MODULES
+    and mod.split(".")[0] not in NONPUBLIC_STDLIB_PACKAGES
+)
 
 
 UNIX_ONLY_STDLIB_MODULES = frozenset(
@@ -88,25 +96,27 @@ UNIX_ONLY_STDLIB_MODULES = frozenset(
 )
 
 
-IMPORTABLE_STDLIB_MODULES = STDLIB_MODULES.copy()
+# Modules and packages that are unimportable, either on any host, or on the current
+# host. IMPORTABLE_STDLIB_MODULES below is STDLIB_MODULES without them.
 
 # Despite its show-up in docs, `distutils.command.bdist_packager` is actually
 # unimportable at runtime.
-IMPORTABLE_STDLIB_MODULES -= {"distutils.command.bdist_packager"}
-
-# lib2to3 package contains Python 2 code, which is unrunnable under Python 3.
-IMPORTABLE_STDLIB_MODULES -= {
-    mod for mod in IMPORTABLE_STDLIB_MODULES if mod.split(".")[0] == "lib2to3"
-}
+UNIMPORTABLE_STDLIB_MODULES = {"distutils.command.bdist_packager"}
 
 # On Windows OS or JVM, UNIX-specific modules are ignored.
 if os.name != "posix":
-    IMPORTABLE_STDLIB_MODULES -= UNIX_ONLY_STDLIB_MODULES
+    UNIMPORTABLE_STDLIB_MODULES |= UNIX_ONLY_STDLIB_MODULES
+
+# lib2to3 package contains Python 2 code, which is unrunnable under Python 3.
+UNIMPORTABLE_STDLIB_PACKAGES = {"lib2to3"}
 
 # Some modules depend on availability of Tk
 if not tk_is_available():
-    IMPORTABLE_STDLIB_MODULES -= {
-        mod
-        for mod in IMPORTABLE_STDLIB_MODULES
-        if mod.split(".")[0] in {"tkinter", "turtle", "turtledemo"}
-    }
+    UNIMPORTABLE_STDLIB_PACKAGES |= {"tkinter", "turtle", "turtledemo"}
+
+IMPORTABLE_STDLIB_MODULES = frozenset(
+    mod
+    for mod in STDLIB_MODULES
+    if mod not in UNIMPORTABLE_STDLIB_MODULES
+    and mod.split(".")[0] not in UNIMPORTABLE_STDLIB_PACKAGES
+)
@@ -5,25 +5,28 @@ A collection of utilities related to standard libraries.
 import __future__
 
 import importlib
-import inspect
 import json
 import pickle
 import re
 import sys
 import warnings
 from functools import cache
+from itertools import takewhile
 from pathlib import Path
 from subprocess import CalledProcessError
+from types import ModuleType
 from typing import Optional, cast
 
-import commentjson
-import regex
 from lazy_object_proxy import Proxy
 
-from .importlib import import_name_from_module, wildcard_import_module
+from .importlib import (
+    import_modules_concurrently,
+    import_name_from_module,
+    wildcard_import_module,
+)
 from .stdlib_list import BUILTINS_NAMES, IMPORTABLE_STDLIB_MODULES, STDLIB_MODULES
 from .typing import SymbolTable
-from .utils import asyncio_subprocess_check_output, unindent_source
+from .utils import asyncio_subprocess_check_output, jsonc_loads, unindent_source
 
 
 __all__ = [
@@ -33,12 +36,22 @@ __all__ = [
     "deprecated_modules",
     "deprecated_names",
     "stdlib_public_names",
+    "modules_with_deprecated_names",
 ]
 
 
 VersionTuple = tuple[int, int]
 
 
+# Compiled once, instead of handing a pattern string to the regex engine on every call
+VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)")
+
+
+# The current Python version, in the form of `3.9`. Computed once here, instead of on
+# every call of the hot functions that default to the current version.
+CURRENT_VERSION = sys.intern(".".join(str(c) for c in sys.version_info[:2]))
+
+
 def import_stdlib_public_names(
     module_name: str, *, lazy: bool = False, include_deprecated: bool = False
 ) -> SymbolTable:
@@ -88,10 +101,26 @@ async def deduce_stdlib_public_interface(module_name: str) -> set[str]:
     if module_name == "builtins":
         return set(BUILTINS_NAMES)
 
+    # Probe `__all__` with the default-valued form of getattr(), instead of attempting
+    # an import statement and catching the ImportError raised for modules that don't
+    # define `__all__`.
+    #
+    # NOTE the in-process import and the wildcard import below deliberately run on the
+    # event loop thread. Running them in worker threads, concurrently with the other
+    # deductions, would let imports of submodules mutate the namespace of a module while
+    # it is being scanned. Only the subprocess launched below overlaps with the other
+    # deductions.
     try:
-        return set(import_name_from_module("__all__", module_name))
-    except ImportError:
-        pass
+        module = importlib.import_module(module_name)
+    except ImportError as exc:
+        raise RuntimeError(
+            f"Fail to deduce public interface of module '{module_name}' due to:\n"
+            + " " * 4
+            + f"{type(exc).__name__}: {exc}"
+        ) from exc
+
+    if (dunder_all := getattr(module, "__all__", None)) is not None:
+        return set(dunder_all)
 
     # Use a separate clean interpreter to retrieve public names.
     #
@@ -155,37 +184,35 @@ async def deduce_stdlib_public_interface(module_name: str) -> set[str]:
     #
     # The only thing we can do is to try best effort.
 
-    def is_another_stdlib(symbol: object) -> bool:
-        """
-        Detect if the symbol is possibly another standard library module imported to
-        this module, hence should not be considered part of the public names of this
-        module.
-        """
-
-        return (
-            inspect.ismodule(symbol)
-            and symbol.__name__ in STDLIB_MODULES
-            and not symbol.__name__.startswith(module_name + ".")
-        )
+    # Computed once, instead of concatenated for every symbol in the loop below
+    submodule_prefix = module_name + "."
 
-    def from_another_stdlib(symbol: object) -> bool:
-        """
-        Detect if the symbol is possibly a public name from another standard library
-        module, imported to this module, hence should not be considered part of the
-        public names of this module.
-        """
+    symtab = wildcard_import_module(module_name)
 
+    # Both checks are fused in a single pass, inlined instead of calling helper
+    # functions per symbol.
+    for name, symbol in symtab.items():
+
+        # The symbol is possibly another standard library module imported to this
+        # module, hence should not be considered part of the public names of this
+        # module.
+        if isinstance(symbol, ModuleType):
+            imported_module = symbol.__name__
+            if imported_module in STDLIB_MODULES and not imported_module.startswith(
+                submodule_prefix
+            ):
+                public_names.remove(name)
+                continue
+
+        # The symbol is possibly a public name from another standard library module,
+        # imported to this module, hence should not be considered part of the public
+        # names of this module.
         origin: Optional[str] = getattr(symbol, "__module__", None)
-        return (
+        if (
             origin in STDLIB_MODULES
             and origin != module_name
-            and not origin.startswith(module_name + ".")
-        )
-
-    symtab = wildcard_import_module(module_name)
-
-    for name, symbol in symtab.items():
-        if is_another_stdlib(symbol) or from_another_stdlib(symbol):
+            and not origin.startswith(submodule_prefix)
+        ):
             public_names.remove(name)
 
     return public_names
@@ -195,15 +222,21 @@ def gather_stdlib_symbol_ids() -> set[int]:
 
     stdlib_symbol_ids: set[int] = set()
 
-    for module_name in IMPORTABLE_STDLIB_MODULES:
+    # Suppress DeprecationWarning, because we know for sure that we are not intended
+    # to use the deprecated names here.
+    #
+    # `contextlib.suppress` is not used because it won't suppress warnings.
+    #
+    # Enter the context once for the whole batch, instead of once per module. Warning
+    # filters are process-wide, so the suppression applies to the worker threads of the
+    # concurrent warm-up as well.
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
 
-        # Suppress DeprecationWarning, because we know for sure that we are not intended
-        # to use the deprecated names here.
-        #
-        # `contextlib.suppress` is not used because it won't suppress warnings.
+        import_modules_concurrently(IMPORTABLE_STDLIB_MODULES)
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", DeprecationWarning)
+        for module_name in IMPORTABLE_STDLIB_MODULES:
 
             module = importlib.import_module(module_name)
 
@@ -213,8 +246,7 @@ def gather_stdlib_symbol_ids() -> set[int]:
                 module_name, include_deprecated=True
             )
 
-            for symbol in symbol_table.values():
-                stdlib_symbol_ids.add(id(symbol))
+            stdlib_symbol_ids.update(map(id, symbol_table.values()))
 
     return stdlib_symbol_ids
 
@@ -233,34 +265,37 @@ def from_stdlib(symbol: object) -> bool:
     return id(symbol) in STDLIB_SYMBOLS_IDS
 
 
+@cache
 def convert_version_to_tuple(version: str) -> VersionTuple:
     """
     Convert version info from string representation to tuple representation.
     The tuple representation is convenient for direct comparison.
     """
 
-    m = regex.fullmatch(r"(?P<major>\d+)\.(?P<minor>\d+)", version)
+    # Plain string operations are sufficient, and cheaper than a regex match
+    major, dot, minor = version.partition(".")
 
-    if not m:
+    if not (dot and major.isdecimal() and minor.isdecimal()):
         raise ValueError(f"{version} is not a valid version")
 
-    major, minor = m.group("major", "minor")
     version_tuple = (int(major), int(minor))
 
     return version_tuple
 
 
 def load_deprecated_modules() -> dict[VersionTuple, frozenset[str]]:
-    """Load DEPRECATED_MODULES from JSON file"""
+    """Load DEPRECATED_MODULES from JSON file, ordered by version ascending"""
 
     json_file = Path(__file__).with_name("deprecated_modules.json")
     json_text = json_file.read_text(encoding="utf-8")
-    json_obj = cast(dict[str, list[str]], commentjson.loads(json_text))
+    json_obj = cast(dict[str, list[str]], jsonc_loads(json_text))
 
-    return {
-        convert_version_to_tuple(version): frozenset(modules)
-        for version, modules in json_obj.items()
-    }
+    return dict(
+        sorted(
+            (convert_version_to_tuple(version), frozenset(modules))
+            for version, modules in json_obj.items()
+        )
+    )
 
 
 def load_deprecated_names() -> dict[VersionTuple, dict[str, frozenset[str]]]:
@@ -268,7 +303,7 @@ def load_deprecated_names() -> dict[VersionTuple, dict[str, frozenset[str]]]:
 
     json_file = Path(__file__).with_name("deprecated_names.json")
     json_text = json_file.read_text(encoding="utf-8")
-    json_obj = cast(dict[str, dict[str, list[str]]], commentjson.loads(json_text))
+    json_obj = cast(dict[str, dict[str, list[str]]], jsonc_loads(json_text))
 
     res: dict[VersionTuple, dict[str, frozenset[str]]] = {}
 
@@ -290,12 +325,51 @@ DEPRECATED_NAMES = cast(
 )
 
 
-def deprecated_modules(version: str = None) -> set[str]:
+def index_deprecated_names_by_module() -> dict[
+    str, tuple[tuple[VersionTuple, frozenset[str]], ...]
+]:
+    """
+    Index DEPRECATED_NAMES by module, in a single pass, so that looking up the
+    deprecated names of a module doesn't need to scan every module of every version.
+
+    The entries of each module are ordered by version ascending.
+    """
+
+    index: dict[str, list[tuple[VersionTuple, frozenset[str]]]] = {}
+
+    for version, modules in DEPRECATED_NAMES.items():
+        for module, names in modules.items():
+            index.setdefault(module, []).append((version, names))
+
+    return {module: tuple(sorted(entries)) for module, entries in index.items()}
+
+
+DEPRECATED_NAMES_BY_MODULE = cast(
+    dict[str, tuple[tuple[VersionTuple, frozenset[str]], ...]],
+    Proxy(index_deprecated_names_by_module),
+)
+
+
+@cache
+def modules_with_deprecated_names() -> frozenset[str]:
+    """
+    Return a frozenset of stdlib modules who have deprecated names in any version.
+
+    Useful to skip calling `deprecated_names()` on modules that certainly have none.
+    """
+
+    return frozenset(DEPRECATED_NAMES_BY_MODULE)
+
+
+@cache
+def deprecated_modules(version: str = None) -> frozenset[str]:
     """
-    Return a set of modules who are deprecated after the given version.
+    Return a frozenset of modules who are deprecated after the given version.
 
     If no version is given, default to the current version.
 
+    The result is memoized, since it's invariant within a process.
+
     The `version` parameter takes argument of the form `3.9`, `4.7`, etc.
     """
 
@@ -304,21 +378,29 @@ def deprecated_modules(version: str = None) -> set[str]:
     else:
         version_tuple = convert_version_to_tuple(version)
 
-    modules: set[str] = set()
-
-    for _version, _modules in DEPRECATED_MODULES.items():
-        if version_tuple >= _version:
-            modules |= _modules
-
-    return modules
+    # Union all matching sets in one call, instead of growing an intermediate set.
+    # The versions are in ascending order, so stop at the first one later than the given
+    # version.
+    return frozenset[str]().union(
+        *(
+            _modules
+            for _version, _modules in takewhile(
+                lambda item: item[0] <= version_tuple, DEPRECATED_MODULES.items()
+            )
+        )
+    )
 
 
-def deprecated_names(module: str, *, version: str = None) -> set[str]:
+@cache
+def deprecated_names(module: str, *, version: str = None) -> frozenset[str]:
     """
-    Return a set of names from a stdlib module who are deprecated after the given version.
+    Return a frozenset of names from a stdlib module who are deprecated after the given
+    version.
 
     If no version is given, default to the current version.
 
+    The result is memoized, since it's invariant within a process.
+
     The `version` parameter takes argument of the form `3.9`, `4.7`, etc.
     """
 
@@ -330,34 +412,42 @@ def deprecated_names(module: str, *, version: str = None) -> set[str]:
     else:
         version_tuple = convert_version_to_tuple(version)
 
-    names: set[str] = set()
+    # Modules without any deprecated names are absent from the index. Look them up with
+    # get(), so that the index is never written to.
+    entries = DEPRECATED_NAMES_BY_MODULE.get(module, ())
 
-    for _version, _modules in DEPRECATED_NAMES.items():
-        if version_tuple < _version:
-            continue
-
-        for _module, _names in _modules.items():
-            if module is None or module == _module:
-                names |= _names
-
-    return names
+    # Same as above, the entries are in ascending order of version
+    return frozenset[str]().union(
+        *(
+            _names
+            for _version, _names in takewhile(
+                lambda entry: entry[0] <= version_tuple, entries
+            )
+        )
+    )
 
 
 @cache
 def load_stdlib_public_names(version: str) -> dict[str, frozenset[str]]:
     """Load stdlib public names data from JSON file"""
 
-    if not re.fullmatch(r"\d+\.\d+", version):
+    if not VERSION_PATTERN.fullmatch(version):
         raise ValueError(f"{version} is not a valid version")
 
     try:
         json_file = Path(__file__).with_name("stdlib_public_names") / (
             version + ".json"
         )
-        json_text = json_file.read_text(encoding="utf-8")
-        json_obj = json.loads(json_text)
-
-        return {module: frozenset(names) for module, names in json_obj.items()}
+        # `json.loads()` accepts UTF-8 bytes directly. Skip the separate decoding step.
+        json_obj = json.loads(json_file.read_bytes())
+
+        # Intern the names, like the identifiers in module namespaces are. Dict lookups
+        # of interned strings in namespaces then succeed on pointer identity, skipping
+        # the string comparison.
+        return {
+            module: frozenset(map(sys.intern, names))
+            for module, names in json_obj.items()
+        }
 
     except FileNotFoundError:
         raise ValueError(
@@ -365,9 +455,9 @@ def load_stdlib_public_names(version: str) -> dict[str, frozenset[str]]:
         ) from None
 
 
-def stdlib_public_names(module: str, *, version: str = None) -> set[str]:
+def stdlib_public_names(module: str, *, version: str = None) -> frozenset[str]:
     """
-    Return a set of public names of a stdlib module, in specific Python version.
+    Return a frozenset of public names of a stdlib module, in specific Python version.
 
     If no version is given, default to the current version.
 
@@ -377,6 +467,6 @@ def stdlib_public_names(module: str, *, version: str = None) -> set[str]:
     if module not in IMPORTABLE_STDLIB_MODULES:
         raise ValueError(f"{module} is not importable stdlib module")
 
-    version = version or ".".join(str(c) for c in sys.version_info[:2])
+    version = version or CURRENT_VERSION
 
-    return set(load_stdlib_public_names(version)[module])
+    return load_stdlib_public_names(version)[module]
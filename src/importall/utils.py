@@ -1,5 +1,7 @@
 import builtins
+import json
 import pickle
+import re
 import subprocess
 import sys
 from collections.abc import Callable, Mapping
@@ -10,7 +12,6 @@ from typing import TYPE_CHECKING, TypeVar
 
 from recipes.asyncio import asyncio_subprocess_check_output
 from recipes.functools import lazy_call
-from recipes.inspect import bind_arguments
 from typing_extensions import ParamSpec
 
 from .functools import nulldecorator
@@ -23,6 +24,7 @@ __all__ = [
     "provide_lazy_version",
     "raises",
     "unindent_source",
+    "jsonc_loads",
     "run_in_new_interpreter",
     "eval_name",
 ]
@@ -105,6 +107,10 @@ def raises(etype: type[Exception], error_message: str) -> IdentityDecorator:
             # Catch Exception instead of BaseException, because we don't want to hinder
             # system-exiting exceptions from propagating up.
             except Exception:
+                # Imported on demand, because it builds on the inspect module, which is
+                # expensive to import, and is only needed on the failure path.
+                from recipes.inspect import bind_arguments
+
                 bound_arguments = bind_arguments(func, *args, **kwargs)
                 formatted_message = error_message.format_map(bound_arguments)
                 raise etype(formatted_message)
@@ -120,6 +126,22 @@ def unindent_source(text: str) -> str:
     return "\n".join(line[margin:] for line in lines)
 
 
+# Whole-line `//` comments, compiled once. Stripping them is a single pass of the regex
+# engine over the text.
+JSONC_COMMENT_PATTERN = re.compile(r"^[ \t]*//.*$\n?", re.MULTILINE)
+
+
+def jsonc_loads(text: str) -> object:
+    """
+    Deserialize JSON text that possibly contains whole-line `//` comments, like the data
+    files shipped with this package.
+
+    Trailing comments after values are not supported.
+    """
+
+    return json.loads(JSONC_COMMENT_PATTERN.sub("", text))
+
+
 # TODO design some creative approaches to add color highlighting to literal source
 # TODO create a subinterpreter within the same process to reduce performance overhead
 async def run_in_new_interpreter(
@@ -3,6 +3,8 @@ import sys
 
 import pytest
 
+from importall.importall import clear_symbols_cache
+
 from .utils import mock_dict
 
 
@@ -18,5 +20,12 @@ def mock_environment(request):
 
     f_globals = request.function.__globals__
 
+    # The memoized symbols of get_all_symbols() refer to objects from the module cache.
+    # Discard them on both sides, so that every test imports afresh, and no test sees
+    # objects from a module cache restored after another test.
+    clear_symbols_cache()
+
     with mock_dict(f_globals, sys.modules, os.environ):
         yield
+
+    clear_symbols_cache()
@@ -113,6 +113,15 @@ def test_get_all_symbols() -> None:
     _test_stdlib_symbols_in_namespace(get_all_symbols())
 
 
+@pytest.mark.usefixtures("mock_environment")
+def test_get_all_symbols_returns_fresh_copy() -> None:
+
+    symtab = get_all_symbols()
+    symtab.clear()
+
+    _test_stdlib_symbols_in_namespace(get_all_symbols())
+
+
 @pytest.mark.usefixtures("mock_environment")
 class TestDeimportall:
     """
@@ -134,6 +143,20 @@ class TestDeimportall:
         # more details.
         assert issubmapping(globals(), origin_globals)
 
+    def test_restore_globals_after_repeated_importall(self) -> None:
+
+        origin_globals = globals().copy()
+
+        importall(globals())
+
+        # The second call doesn't inject names exclusive to the zlib module, e.g. adler32
+        importall(globals(), ignore=["zlib"])
+
+        deimportall(globals())
+
+        assert "adler32" not in globals()
+        assert issubmapping(globals(), origin_globals)
+
     def test_called_at_non_module_level(self) -> None:
 
         with pytest.raises(
@@ -1,4 +1,5 @@
 import email.generator
+import email.mime.text
 import functools
 import sys
 
@@ -6,7 +7,9 @@ import pytest
 
 from importall.importlib import (
     clean_up_import_cache,
+    import_modules_concurrently,
     import_name_from_module,
+    import_names_from_module,
     wildcard_import_module,
 )
 
@@ -34,6 +37,44 @@ def test_import_name_from_module() -> None:
         assert import_name_from_module("xxx", INEXISTENT_MODULE)
 
 
+def test_import_name_from_module_not_yet_imported_submodule(monkeypatch) -> None:
+
+    monkeypatch.delitem(sys.modules, "email.mime.text")
+    monkeypatch.delattr(email.mime, "text")
+
+    text = import_name_from_module("text", "email.mime")
+    assert text.__name__ == "email.mime.text"
+    assert sys.modules["email.mime.text"] is text
+
+
+def test_import_name_from_module_missing_name() -> None:
+
+    with pytest.raises(ImportError) as exc_info:
+        import_name_from_module("xxx", "functools")
+
+    assert str(exc_info.value) == "cannot import name 'xxx' from 'functools'"
+    assert exc_info.value.name == "functools"
+
+
+def test_import_names_from_module() -> None:
+
+    assert import_names_from_module(["partial", "reduce"], "functools") == {
+        "partial": functools.partial,
+        "reduce": functools.reduce,
+    }
+
+    # import submodule
+    assert import_names_from_module(["generator"], "email") == {
+        "generator": email.generator
+    }
+
+    with pytest.raises(ImportError):
+        import_names_from_module(["partial", "xxx"], "functools")
+
+    with pytest.raises(ModuleNotFoundError):
+        import_names_from_module(["xxx"], INEXISTENT_MODULE)
+
+
 def test_wildcard_import_module() -> None:
 
     # Wildcard import a module that defines __all__
@@ -50,6 +91,19 @@ def test_wildcard_import_module() -> None:
         wildcard_import_module(INEXISTENT_MODULE)
 
 
+@pytest.mark.usefixtures("mock_environment")
+def test_import_modules_concurrently() -> None:
+
+    for module_name in ("colorsys", "json.tool"):
+        clean_up_import_cache(module_name)
+
+    import_modules_concurrently(["colorsys", "json.tool", INEXISTENT_MODULE])
+
+    assert "colorsys" in sys.modules
+    assert "json.tool" in sys.modules
+    assert INEXISTENT_MODULE not in sys.modules
+
+
 def test_clean_up_import_cache() -> None:
 
     with pytest.deprecated_call(match="the binhex module is deprecated"):
@@ -61,3 +115,14 @@ def test_clean_up_import_cache() -> None:
 
     with pytest.deprecated_call(match="the binhex module is deprecated"):
         import binhex
+
+
+@pytest.mark.usefixtures("mock_environment")
+def test_clean_up_import_cache_of_dotted_module() -> None:
+
+    import email.mime.text
+
+    clean_up_import_cache("email.mime")
+
+    assert "email.mime" not in sys.modules
+    assert "email.mime.text" not in sys.modules
@@ -1,3 +1,5 @@
+import importlib
+import importlib.util
 import subprocess
 import sys
 from subprocess import CalledProcessError
@@ -6,7 +8,13 @@ import pytest
 from hypothesis import given
 from hypothesis.strategies import integers
 
-from importall.inspect import getcallerframe, is_called_at_module_level
+from importall.inspect import (
+    GetImporterFrameError,
+    get_importer_frame,
+    getcallerframe,
+    is_called_at_module_level,
+    is_module_level_frame,
+)
 
 
 @given(integers())
@@ -55,3 +63,64 @@ g()
     """
 
     exec(source, {"is_called_at_module_level": is_called_at_module_level})
+
+
+def test_is_module_level_frame() -> None:
+
+    assert not is_module_level_frame(sys._getframe())
+
+    namespace = {"sys": sys, "is_module_level_frame": is_module_level_frame}
+    exec("result = is_module_level_frame(sys._getframe())", namespace)
+    assert namespace["result"]
+
+
+@pytest.mark.usefixtures("mock_environment")
+def test_get_importer_frame(tmp_path, monkeypatch) -> None:
+
+    source = (
+        "from importall.inspect import get_importer_frame\n"
+        "importer_frame = get_importer_frame()\n"
+    )
+
+    for module_name in (
+        "_importall_test_plain_import",
+        "_importall_test_import_module",
+        "_importall_test_lazy_loader",
+    ):
+        (tmp_path / (module_name + ".py")).write_text(source, encoding="utf-8")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    # Import by a plain import statement
+    def importer():
+        import _importall_test_plain_import as module
+
+        return module.importer_frame, sys._getframe()
+
+    importer_frame, frame = importer()
+    assert importer_frame.f_code is frame.f_code
+
+    # Import by importlib.import_module()
+    def importer():
+        module = importlib.import_module("_importall_test_import_module")
+        return module.importer_frame, sys._getframe()
+
+    importer_frame, frame = importer()
+    assert importer_frame.f_code is frame.f_code
+
+    # Import by importlib.util.LazyLoader, where the module is executed on the first
+    # attribute access
+    def importer():
+        spec = importlib.util.find_spec("_importall_test_lazy_loader")
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        loader.exec_module(module)
+        return module.importer_frame, sys._getframe()
+
+    importer_frame, frame = importer()
+    assert importer_frame.f_code is frame.f_code
+
+    with pytest.raises(GetImporterFrameError):
+        get_importer_frame()
@@ -1,15 +1,19 @@
 import builtins
+import dataclasses
 import functools
+import typing
 from typing import Any
 
 import pytest
 
 from importall.stdlib_utils import (
+    convert_version_to_tuple,
     deduce_stdlib_public_interface,
     deprecated_modules,
     deprecated_names,
     from_stdlib,
     import_stdlib_public_names,
+    modules_with_deprecated_names,
     stdlib_public_names,
 )
 
@@ -46,6 +50,27 @@ def test_from_stdlib() -> None:
     assert not from_stdlib(pytest)
 
 
+def test_from_stdlib_dynamically_created_symbols() -> None:
+
+    # Symbols created by user code through stdlib factories report a stdlib module as
+    # their `__module__`, but don't come from standard libraries.
+
+    UserId = typing.NewType("UserId", int)
+    assert not from_stdlib(UserId)
+
+    Point = dataclasses.make_dataclass("Point", ["x", "y"])
+    assert not from_stdlib(Point)
+
+
+def test_convert_version_to_tuple() -> None:
+    assert convert_version_to_tuple("3.9") == (3, 9)
+    assert convert_version_to_tuple("3.10") == (3, 10)
+
+    for version in ["3", "3.", ".9", "3.9.1", "3.x", " 3.9"]:
+        with pytest.raises(ValueError):
+            convert_version_to_tuple(version)
+
+
 def test_deprecated_modules() -> None:
     assert "distutils.command.bdist_msi" in deprecated_modules()
     assert "distutils.command.bdist_msi" not in deprecated_modules("3.8")
@@ -56,6 +81,11 @@ def test_deprecated_names() -> None:
     assert "List" not in deprecated_names("typing", version="3.8")
 
 
+def test_modules_with_deprecated_names() -> None:
+    assert "typing" in modules_with_deprecated_names()
+    assert "functools" not in modules_with_deprecated_names()
+
+
 def test_stdlib_public_names() -> None:
     assert "partial" in stdlib_public_names("functools")
     assert "cache" not in stdlib_public_names("functools", version="3.8")